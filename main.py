@@ -1,7 +1,169 @@
 import ast
+import builtins
+import hashlib
+import os
+import threading
+from collections import OrderedDict, deque
 from typing import Any
 
+_FILENAME = "<user_code>"
+_RESULT_CACHE_SIZE = 256
+# Smallest batch for which starting worker processes beats analyzing in-process.
+_POOL_MIN_SAMPLES = 256
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+_BUILTINS = frozenset(vars(builtins)) | {"True", "False", "None"}
+_DIV_OPS = frozenset({ast.Div, ast.FloorDiv, ast.Mod})
+_ARITH_OPS = frozenset({ast.Add, ast.Sub, ast.Mult})
+_STORE = ast.Store
+_LOAD = ast.Load
+# Childless nodes no check looks at: contexts, operators, literals and
+# import aliases. The walk never queues them.
+_SKIPPED_NODES = frozenset(
+    cls
+    for base in (ast.expr_context, ast.operator, ast.boolop, ast.unaryop, ast.cmpop)
+    for cls in base.__subclasses__()
+) | {ast.Constant, ast.alias, ast.Pass, ast.Break, ast.Continue}
+
+class _Analyzer(ast.NodeVisitor):
+    """Collect the state for every check in a single visit of the AST."""
+
+    def __init__(self):
+        self.defined_names = set()
+        self.imported_names = set()
+        self.assigned_names = {}
+        self.used_names = set()
+        self.function_names = set()
+        self.loaded_names = []
+        self.functions = []
+        self.returns_by_func = {}
+        self.binops_by_func = {}
+        self.enclosing_functions = ()
+        self.enclosing_loops = ()
+        self.loops = []
+        self.appending_loops = set()
+        self.division_errors = []
+        self.division_suggestions = []
+        self.redundant_errors = []
+
+    def visit(self, tree):
+        """Visit each node of the tree once through the per-type method table.
+
+        Nodes whose type is in _SKIPPED_NODES are never queued, so a visit_*
+        method for one of those types only runs once it leaves that set.
+        """
+        # Iterate rather than recurse through generic_visit: deeply nested
+        # expressions would otherwise hit the recursion limit. Each queued
+        # node carries the functions and loops enclosing it, so returns,
+        # arithmetic and append calls can be attributed without walking any
+        # body again.
+        get_method = self._dispatch.get
+        iter_child_nodes = ast.iter_child_nodes
+        _FunctionDef = ast.FunctionDef
+        _For = ast.For
+        skipped = _SKIPPED_NODES
+        todo = deque([(tree, (), ())])
+        popleft = todo.popleft
+        extend = todo.extend
+        while todo:
+            node, functions, loops = popleft()
+            self.enclosing_functions = functions
+            self.enclosing_loops = loops
+            node_type = type(node)
+            method = get_method(node_type)
+            if method is not None:
+                method(self, node)
+            if node_type is _FunctionDef:
+                functions += (node,)
+            elif node_type is _For:
+                loops += (node,)
+            extend([
+                (child, functions, loops)
+                for child in iter_child_nodes(node)
+                if type(child) not in skipped
+            ])
+
+    def visit_Import(self, node):
+        """Record names bound by an import statement."""
+        for name in node.names:
+            self.imported_names.add(name.asname or name.name.split('.')[0])
+
+    def visit_ImportFrom(self, node):
+        """Record names bound by a from-import statement."""
+        for name in node.names:
+            self.imported_names.add(name.asname or name.name)
+
+    def visit_Name(self, node):
+        """Record where a name is stored or loaded."""
+        ctx = type(node.ctx)
+        if ctx is _STORE:
+            self.defined_names.add(node.id)
+            self.assigned_names[node.id] = node.lineno
+        elif ctx is _LOAD:
+            self.used_names.add(node.id)
+            self.loaded_names.append(node)
+
+    def visit_FunctionDef(self, node):
+        """Record a function definition and its parameters."""
+        self.defined_names.add(node.name)
+        self.function_names.add(node.name)
+        for arg in node.args.args:
+            self.defined_names.add(arg.arg)
+            self.assigned_names[arg.arg] = arg.lineno
+        self.functions.append(node)
+        self.returns_by_func[node] = []
+        self.binops_by_func[node] = []
+
+    def visit_Return(self, node):
+        """Attribute a returned value to its enclosing functions."""
+        if node.value:
+            for func in self.enclosing_functions:
+                self.returns_by_func[func].append(node)
+
+    def visit_BinOp(self, node):
+        """Detect potential division by zero and record arithmetic for type hints."""
+        op = type(node.op)
+        if op in _ARITH_OPS:
+            for func in self.enclosing_functions:
+                self.binops_by_func[func].append(node)
+        elif op in _DIV_OPS:
+            right = node.right
+            if type(right) is ast.Constant and right.value == 0:
+                self.division_errors.append(f"Division by zero at line {node.lineno}. Fix: Avoid dividing by zero.")
+            elif type(right) is ast.Name:
+                self.division_suggestions.append(f"Line {node.lineno}: Add check to ensure '{right.id}' is not zero before division.")
+
+    def visit_For(self, node):
+        """Record a loop for the inefficient loop check."""
+        self.loops.append(node)
+
+    def visit_Call(self, node):
+        """Flag the loops enclosing an append call."""
+        if type(node.func) is ast.Name and node.func.id == "append":
+            self.appending_loops.update(self.enclosing_loops)
+
+    def visit_Assign(self, node):
+        """Detect simple redundant operations."""
+        if len(node.targets) == 1 and type(node.targets[0]) is ast.Name:
+            target = node.targets[0].id
+            value = node.value
+            if type(value) is ast.Name and value.id == target:
+                self.redundant_errors.append(f"Redundant assignment '{target} = {target}' at line {node.lineno}. Fix: Remove this line.")
+            elif (type(value) is ast.BinOp and 
+                  type(value.op) is ast.Add and 
+                  type(value.right) is ast.Constant and 
+                  value.right.value == 0):
+                self.redundant_errors.append(f"Redundant operation '{target} = {target} + 0' at line {node.lineno}. Fix: Remove this line.")
+
+_Analyzer._dispatch = {
+    getattr(ast, name[len("visit_"):]): method
+    for name, method in vars(_Analyzer).items()
+    if name.startswith("visit_")
+}
+
 class CodeDebugger:
+    __slots__ = ("code", "tree", "errors", "optimizations", "suggestions")
+
     def __init__(self, code_string):
         """Initialize with the code to debug."""
         self.code = code_string.strip()
@@ -13,7 +175,7 @@ class CodeDebugger:
     def parse_code(self):
         """Parse the code into an AST and handle syntax errors."""
         try:
-            self.tree = ast.parse(self.code, filename="<user_code>")
+            self.tree = compile(self.code, _FILENAME, "exec", flags=ast.PyCF_ONLY_AST, dont_inherit=True)
             return True
         except (SyntaxError, IndentationError, TabError) as e:
             self.errors.append(f"SyntaxError: {str(e)} at line {e.lineno}")
@@ -22,173 +184,152 @@ class CodeDebugger:
             self.errors.append(f"Unexpected error during parsing: {str(e)}")
             return False
 
-    def check_undefined_variables(self):
-        """Find undefined variables, excluding built-ins and imports."""
-        if not self.tree:
-            return
+    def _run_passes(self):
+        """Run every check in a single visit of the AST.
 
-        builtins = set(__import__("builtins").__dict__.keys()) | {"True", "False", "None"}
-        defined_names = set()
-        imported_names = set()
-
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Import):
-                for name in node.names:
-                    imported_names.add(name.asname or name.name.split('.')[0])
-            elif isinstance(node, ast.ImportFrom):
-                for name in node.names:
-                    imported_names.add(name.asname or name.name)
-            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
-                defined_names.add(node.id)
-            elif isinstance(node, ast.FunctionDef):
-                defined_names.add(node.name)
-                for arg in node.args.args:
-                    defined_names.add(arg.arg)
-
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                if (node.id not in defined_names and 
-                    node.id not in builtins and 
-                    node.id not in imported_names):
-                    self.errors.append(f"Undefined variable '{node.id}' used at line {node.lineno}. Fix: Define '{node.id}' before use.")
-
-    def check_unused_variables(self):
-        """Find variables defined but never used, excluding function names."""
-        if not self.tree:
-            return
+        Requires a successful parse_code(); analyze() only calls it then.
+        """
+        analyzer = _Analyzer()
+        analyzer.visit(self.tree)
 
-        defined_names = {}
-        used_names = set()
-        function_names = set()
-
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                function_names.add(node.name)
-                for arg in node.args.args:
-                    defined_names[arg.arg] = arg.lineno
-            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
-                defined_names[node.id] = node.lineno
-            elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                used_names.add(node.id)
-
-        for name, lineno in defined_names.items():
-            if name not in used_names and name not in function_names:
-                self.errors.append(f"Unused variable '{name}' defined at line {lineno}.")
+        self._report_undefined_variables(analyzer)
+        self._report_unused_variables(analyzer)
+        self.errors.extend(analyzer.division_errors)
+        self.errors.extend(analyzer.redundant_errors)
+        self._report_inefficient_loops(analyzer)
+        self.suggestions.extend(analyzer.division_suggestions)
+        self._suggest_type_hints(analyzer)
 
-    def check_division_by_zero(self):
-        """Detect potential division by zero."""
-        if not self.tree:
+    def _report_undefined_variables(self, analyzer):
+        """Find undefined variables, excluding built-ins and imports."""
+        # Resolve the undefined names with set differences once, so each
+        # load needs a single membership test.
+        undefined = analyzer.used_names - analyzer.defined_names - analyzer.imported_names - _BUILTINS
+        if not undefined:
             return
 
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Div, ast.FloorDiv, ast.Mod)):
-                if isinstance(node.right, ast.Constant) and node.right.value == 0:
-                    self.errors.append(f"Division by zero at line {node.lineno}. Fix: Avoid dividing by zero.")
-                elif isinstance(node.right, ast.Name):
-                    self.suggestions.append(f"Line {node.lineno}: Add check to ensure '{node.right.id}' is not zero before division.")
+        errs_append = self.errors.append
+        for node in analyzer.loaded_names:
+            if node.id in undefined:
+                errs_append(f"Undefined variable '{node.id}' used at line {node.lineno}. Fix: Define '{node.id}' before use.")
 
-    def check_inefficient_loops(self):
-        """Detect inefficient loops and suggest optimizations."""
-        if not self.tree:
-            return
+    def _report_unused_variables(self, analyzer):
+        """Find variables defined but never used, excluding function names."""
+        errs_append = self.errors.append
+        used_names = analyzer.used_names
+        function_names = analyzer.function_names
+        for name, lineno in analyzer.assigned_names.items():
+            if name not in used_names and name not in function_names:
+                errs_append(f"Unused variable '{name}' defined at line {lineno}.")
 
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.For):
-                if (isinstance(node.iter, ast.Call) and 
-                    isinstance(node.iter.func, ast.Name) and 
-                    node.iter.func.id == "range"):
-                    is_simple_sum = all(
-                        isinstance(n, ast.AugAssign) and isinstance(n.op, ast.Add)
-                        for n in node.body
-                    )
-                    if is_simple_sum:
-                        self.optimizations.append(
-                            f"Line {node.lineno}: Replace loop with sum(range(...)) for efficiency."
-                        )
-                elif any(isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id == "append" 
-                         for n in ast.walk(node)):
-                    self.optimizations.append(
-                        f"Line {node.lineno}: Consider using a list comprehension for efficiency if applicable."
+    def _report_inefficient_loops(self, analyzer):
+        """Detect inefficient loops and suggest optimizations."""
+        opt_append = self.optimizations.append
+        appending_loops = analyzer.appending_loops
+        _Call = ast.Call
+        _Name = ast.Name
+        _AugAssign = ast.AugAssign
+        _Add = ast.Add
+        for node in analyzer.loops:
+            if (type(node.iter) is _Call and 
+                type(node.iter.func) is _Name and 
+                node.iter.func.id == "range"):
+                is_simple_sum = all(
+                    type(n) is _AugAssign and type(n.op) is _Add
+                    for n in node.body
+                )
+                if is_simple_sum:
+                    opt_append(
+                        f"Line {node.lineno}: Replace loop with sum(range(...)) for efficiency."
                     )
+            elif node in appending_loops:
+                opt_append(
+                    f"Line {node.lineno}: Consider using a list comprehension for efficiency if applicable."
+                )
 
-    def check_redundant_code(self):
-        """Detect simple redundant operations."""
-        if not self.tree:
-            return
-
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Assign):
-                if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
-                    target = node.targets[0].id
-                    if isinstance(node.value, ast.Name) and node.value.id == target:
-                        self.errors.append(f"Redundant assignment '{target} = {target}' at line {node.lineno}. Fix: Remove this line.")
-                    elif (isinstance(node.value, ast.BinOp) and 
-                          isinstance(node.value.op, ast.Add) and 
-                          isinstance(node.value.right, ast.Constant) and 
-                          node.value.right.value == 0):
-                        self.errors.append(f"Redundant operation '{target} = {target} + 0' at line {node.lineno}. Fix: Remove this line.")
-
-    def suggest_type_hints(self):
+    def _suggest_type_hints(self, analyzer):
         """Suggest adding type hints for functions."""
-        if not self.tree:
-            return
+        sug_append = self.suggestions.append
+        returns_by_func = analyzer.returns_by_func
+        binops_by_func = analyzer.binops_by_func
+        _Name = ast.Name
+        _Constant = ast.Constant
+        _List = ast.List
+        for node in analyzer.functions:
+            return_type = "Any"
+            returns = returns_by_func[node]
+            if returns:
+                ret_node = returns[0]
+                if type(ret_node.value) is _Constant:
+                    if isinstance(ret_node.value.value, int):
+                        return_type = "int"
+                    elif isinstance(ret_node.value.value, float):
+                        return_type = "float"
+                    elif isinstance(ret_node.value.value, str):
+                        return_type = "str"
+                elif type(ret_node.value) is _List:
+                    return_type = "list"
+            # Infer parameter types from usage
+            param_types = {arg.arg: "Any" for arg in node.args.args}
+            for binop in binops_by_func[node]:
+                for operand in (binop.left, binop.right):
+                    if type(operand) is _Name and operand.id in param_types:
+                        param_types[operand.id] = "int"  # Default to int for arithmetic
 
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                args = [arg.arg for arg in node.args.args]
-                return_type = "Any"
-                for ret_node in ast.walk(node):
-                    if isinstance(ret_node, ast.Return) and ret_node.value:
-                        if isinstance(ret_node.value, ast.Constant):
-                            if isinstance(ret_node.value.value, int):
-                                return_type = "int"
-                            elif isinstance(ret_node.value.value, float):
-                                return_type = "float"
-                            elif isinstance(ret_node.value.value, str):
-                                return_type = "str"
-                        elif isinstance(ret_node.value, ast.List):
-                            return_type = "list"
-                        break
-                # Infer parameter types from usage
-                param_types = {arg.arg: "Any" for arg in node.args.args}
-                for body_node in ast.walk(node):
-                    if isinstance(body_node, ast.BinOp):
-                        if isinstance(body_node.op, (ast.Add, ast.Sub, ast.Mult)):
-                            for arg in node.args.args:
-                                if (isinstance(body_node.left, ast.Name) and body_node.left.id == arg.arg) or \
-                                   (isinstance(body_node.right, ast.Name) and body_node.right.id == arg.arg):
-                                    param_types[arg.arg] = "int"  # Default to int for arithmetic
-
-                if not node.returns:
-                    self.suggestions.append(f"Line {node.lineno}: Add type hint for return value of '{node.name}' (e.g., -> {return_type}).")
-                for arg in node.args.args:
-                    if not arg.annotation:
-                        self.suggestions.append(f"Line {arg.lineno}: Add type hint for parameter '{arg.arg}' in '{node.name}' (e.g., {arg.arg}: {param_types[arg.arg]}).")
+            if not node.returns:
+                sug_append(f"Line {node.lineno}: Add type hint for return value of '{node.name}' (e.g., -> {return_type}).")
+            for arg in node.args.args:
+                if not arg.annotation:
+                    sug_append(f"Line {arg.lineno}: Add type hint for parameter '{arg.arg}' in '{node.name}' (e.g., {arg.arg}: {param_types[arg.arg]}).")
 
     def analyze(self):
-        """Run all analysis steps and return results."""
-        if not self.parse_code():
-            return {"errors": self.errors, "optimizations": [], "suggestions": []}
+        """Run all analysis steps and return results.
 
-        self.check_undefined_variables()
-        self.check_unused_variables()
-        self.check_division_by_zero()
-        self.check_inefficient_loops()
-        self.check_redundant_code()
-        self.suggest_type_hints()
+        Results for code analyzed before come from a cache without parsing,
+        so self.tree stays None in that case.
+        """
+        # Results depend only on the code, so repeated snippets are served
+        # from a small LRU cache keyed on a digest of the source. The lock
+        # keeps lookups and evictions from other threads from interleaving.
+        key = hashlib.blake2b(self.code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(key)
+            if cached is not None:
+                _RESULT_CACHE.move_to_end(key)
+        if cached is not None:
+            errors, optimizations, suggestions = cached
+            self.errors.extend(errors)
+            self.optimizations.extend(optimizations)
+            self.suggestions.extend(suggestions)
+        else:
+            # Cache only what this call adds, so findings already on the
+            # instance never leak into results for other callers.
+            marks = (len(self.errors), len(self.optimizations), len(self.suggestions))
+            if self.parse_code():
+                self._run_passes()
+            results = (
+                tuple(self.errors[marks[0]:]),
+                tuple(self.optimizations[marks[1]:]),
+                tuple(self.suggestions[marks[2]:]),
+            )
+            with _RESULT_CACHE_LOCK:
+                _RESULT_CACHE[key] = results
+                if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                    _RESULT_CACHE.popitem(last=False)
 
         return {"errors": self.errors, "optimizations": self.optimizations, "suggestions": self.suggestions}
 
-def debug_code(code_string, sample_name):
-    """Debug a single code sample and display results."""
+def analyze_code(code_string):
+    """Analyze a single code sample and return its results."""
+    return CodeDebugger(code_string).analyze()
+
+def print_results(code_string, sample_name, results):
+    """Display the results of debugging a single code sample."""
     print(f"\n{'='*20} Debugging sample: {sample_name} {'='*20}")
     print("Code:")
     print(code_string.strip())
     print("-" * 50)
 
-    debugger = CodeDebugger(code_string)
-    results = debugger.analyze()
-
     if results["errors"]:
         print("Errors found:")
         for error in results["errors"]:
@@ -210,6 +351,10 @@ def debug_code(code_string, sample_name):
     else:
         print("\nNo code improvement suggestions.")
 
+def debug_code(code_string, sample_name):
+    """Debug a single code sample and display results."""
+    print_results(code_string, sample_name, analyze_code(code_string))
+
 def debug_multiple_samples():
     """Debug a list of sample codes."""
     samples = [
@@ -244,8 +389,21 @@ def broken_function(a)
         },
     ]
 
-    for sample in samples:
-        debug_code(sample["code"], sample["name"])
+    # Samples are independent and analysis is CPU-bound, so large batches
+    # are spread across processes. Small ones run in-process, since worker
+    # startup costs far more than analyzing a few snippets.
+    codes = [sample["code"] for sample in samples]
+    workers = os.cpu_count() or 1
+    if workers > 1 and len(codes) > max(workers, _POOL_MIN_SAMPLES):
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(codes) // (4 * workers))
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(analyze_code, codes, chunksize=chunksize))
+    else:
+        results = map(analyze_code, codes)
+    for sample, result in zip(samples, results):
+        print_results(sample["code"], sample["name"], result)
 
 if __name__ == "__main__":
     debug_multiple_samples()
\ No newline at end of file